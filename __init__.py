@@ -13,27 +13,36 @@ This package includes:
 For more information, see README_color_picker.md
 """
 
-# Import main components for easy access
-from .ansi_colors import (
+import importlib
+
+# Main components for easy access; ansi_colors is imported on first use (PEP 562)
+__all__ = (
     # Basic colors
-    black, red, green, yellow, blue, magenta, cyan, white,
-    bright_black, bright_red, bright_green, bright_yellow,
-    bright_blue, bright_magenta, bright_cyan, bright_white,
+    'black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white',
+    'bright_black', 'bright_red', 'bright_green', 'bright_yellow',
+    'bright_blue', 'bright_magenta', 'bright_cyan', 'bright_white',
     
     # Background colors
-    bg_black, bg_red, bg_green, bg_yellow, bg_blue, bg_magenta, bg_cyan, bg_white,
-    bg_bright_black, bg_bright_red, bg_bright_green, bg_bright_yellow,
-    bg_bright_blue, bg_bright_magenta, bg_bright_cyan, bg_bright_white,
+    'bg_black', 'bg_red', 'bg_green', 'bg_yellow', 'bg_blue', 'bg_magenta', 'bg_cyan', 'bg_white',
+    'bg_bright_black', 'bg_bright_red', 'bg_bright_green', 'bg_bright_yellow',
+    'bg_bright_blue', 'bg_bright_magenta', 'bg_bright_cyan', 'bg_bright_white',
     
     # Styles
-    bold, dim, italic, underline, blink, reverse, hidden, strikethrough,
+    'bold', 'dim', 'italic', 'underline', 'blink', 'reverse', 'hidden', 'strikethrough',
     
     # Advanced coloring
-    color256, bg_color256, rgb, bg_rgb,
+    'color256', 'bg_color256', 'rgb', 'bg_rgb', 'rgb_unchecked', 'bg_rgb_unchecked',
     
     # Utility functions
-    style, strip_ansi, supports_color, print_color_table
+    'style', 'strip_ansi', 'supports_color', 'print_color_table',
 )
 
+def __getattr__(name):
+    if name in __all__:
+        value = getattr(importlib.import_module('.ansi_colors', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Version information
 __version__ = '1.0.0'
\ No newline at end of file
@@ -23,18 +23,39 @@ Options:
     --help              Show this help message
 """
 
+import io
 import os
 import sys
-import re
-import ctypes
 from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import product
+
+_kernel32 = None
+
+def _get_kernel32():
+    """Load kernel32 once, with prototypes for the console-mode calls."""
+    global _kernel32
+    if _kernel32 is None:
+        import ctypes  # Only needed (and only loaded) on Windows
+        from ctypes import wintypes
+        k32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        k32.GetStdHandle.argtypes = [wintypes.DWORD]
+        k32.GetStdHandle.restype = wintypes.HANDLE
+        k32.GetConsoleMode.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+        k32.GetConsoleMode.restype = wintypes.BOOL
+        k32.SetConsoleMode.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        k32.SetConsoleMode.restype = wintypes.BOOL
+        _kernel32 = k32
+    return _kernel32
 
 # Enable ANSI escapes on Windows consoles
 def enable_windows_ansi():
     if os.name == 'nt':
         try:
-            k32 = ctypes.windll.kernel32
-            h = k32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            import ctypes
+            k32 = _get_kernel32()
+            h = k32.GetStdHandle(-11 & 0xFFFFFFFF)  # STD_OUTPUT_HANDLE
             mode = ctypes.c_ulong()
             if k32.GetConsoleMode(h, ctypes.byref(mode)):
                 # ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
@@ -50,197 +71,378 @@ ANSI_ENABLED = enable_windows_ansi()
 # ANSI escape sequence constants
 ESC = '\033['
 RESET = f'{ESC}0m'
+DEFAULT_FG = f'{ESC}39m'
+DEFAULT_BG = f'{ESC}49m'
 
 # Color definitions
-Color = namedtuple('Color', ['name', 'ansi_fg', 'ansi_bg', 'rgb', 'hex'])
+Color = namedtuple('Color', ['name', 'ansi_fg', 'ansi_bg', 'rgb', 'hex', 'fg_seq', 'bg_seq',
+                             'fg_escape', 'bg_escape'])
+
+def make_color(name, ansi_fg, ansi_bg, rgb, hex_color):
+    """Create a Color with its escape sequences (and their printable form) precomputed."""
+    return Color(name, ansi_fg, ansi_bg, rgb, hex_color,
+                 f'{ESC}{ansi_fg}m', f'{ESC}{ansi_bg}m',
+                 f'\\033[{ansi_fg}m', f'\\033[{ansi_bg}m')
 
 # Basic 8 colors
 BASIC_COLORS = [
-    Color('Black',        '30', '40', (0, 0, 0),       '#000000'),
-    Color('Red',          '31', '41', (170, 0, 0),     '#AA0000'),
-    Color('Green',        '32', '42', (0, 170, 0),     '#00AA00'),
-    Color('Yellow',       '33', '43', (170, 85, 0),    '#AA5500'),
-    Color('Blue',         '34', '44', (0, 0, 170),     '#0000AA'),
-    Color('Magenta',      '35', '45', (170, 0, 170),   '#AA00AA'),
-    Color('Cyan',         '36', '46', (0, 170, 170),   '#00AAAA'),
-    Color('White',        '37', '47', (170, 170, 170), '#AAAAAA'),
+    make_color('Black',        '30', '40', (0, 0, 0),       '#000000'),
+    make_color('Red',          '31', '41', (170, 0, 0),     '#AA0000'),
+    make_color('Green',        '32', '42', (0, 170, 0),     '#00AA00'),
+    make_color('Yellow',       '33', '43', (170, 85, 0),    '#AA5500'),
+    make_color('Blue',         '34', '44', (0, 0, 170),     '#0000AA'),
+    make_color('Magenta',      '35', '45', (170, 0, 170),   '#AA00AA'),
+    make_color('Cyan',         '36', '46', (0, 170, 170),   '#00AAAA'),
+    make_color('White',        '37', '47', (170, 170, 170), '#AAAAAA'),
 ]
 
 # Bright versions of the 8 basic colors
 BRIGHT_COLORS = [
-    Color('Bright Black',   '90', '100', (85, 85, 85),     '#555555'),
-    Color('Bright Red',     '91', '101', (255, 85, 85),    '#FF5555'),
-    Color('Bright Green',   '92', '102', (85, 255, 85),    '#55FF55'),
-    Color('Bright Yellow',  '93', '103', (255, 255, 85),   '#FFFF55'),
-    Color('Bright Blue',    '94', '104', (85, 85, 255),    '#5555FF'),
-    Color('Bright Magenta', '95', '105', (255, 85, 255),   '#FF55FF'),
-    Color('Bright Cyan',    '96', '106', (85, 255, 255),   '#55FFFF'),
-    Color('Bright White',   '97', '107', (255, 255, 255),  '#FFFFFF'),
+    make_color('Bright Black',   '90', '100', (85, 85, 85),     '#555555'),
+    make_color('Bright Red',     '91', '101', (255, 85, 85),    '#FF5555'),
+    make_color('Bright Green',   '92', '102', (85, 255, 85),    '#55FF55'),
+    make_color('Bright Yellow',  '93', '103', (255, 255, 85),   '#FFFF55'),
+    make_color('Bright Blue',    '94', '104', (85, 85, 255),    '#5555FF'),
+    make_color('Bright Magenta', '95', '105', (255, 85, 255),   '#FF55FF'),
+    make_color('Bright Cyan',    '96', '106', (85, 255, 255),   '#55FFFF'),
+    make_color('Bright White',   '97', '107', (255, 255, 255),  '#FFFFFF'),
 ]
 
+# Two-digit uppercase hex for every channel value
+HEX2 = tuple(f'{v:02X}' for v in range(256))
+
+# Channel intensities of the 6x6x6 RGB cube (0, 95, 135, 175, 215, 255)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
 # Generate 216 colors of the 6x6x6 RGB cube (colors 16-231)
-RGB_CUBE_COLORS = []
-for r in range(6):
-    for g in range(6):
-        for b in range(6):
-            color_num = 16 + (r * 36) + (g * 6) + b
-            # Calculate RGB values (0, 95, 135, 175, 215, 255)
-            rgb_r = 0 if r == 0 else (r * 40 + 55)
-            rgb_g = 0 if g == 0 else (g * 40 + 55)
-            rgb_b = 0 if b == 0 else (b * 40 + 55)
-            hex_color = f'#{rgb_r:02X}{rgb_g:02X}{rgb_b:02X}'
-            name = f'Color {color_num}'
-            RGB_CUBE_COLORS.append(Color(name, f'38;5;{color_num}', f'48;5;{color_num}', 
-                                         (rgb_r, rgb_g, rgb_b), hex_color))
-
-# Generate 24 grayscale colors (colors 232-255)
-GRAYSCALE_COLORS = []
-for i in range(24):
-    color_num = 232 + i
-    # Calculate grayscale value (8, 18, 28, ..., 238)
-    gray_value = 8 + i * 10
-    hex_color = f'#{gray_value:02X}{gray_value:02X}{gray_value:02X}'
-    name = f'Gray {color_num}'
-    GRAYSCALE_COLORS.append(Color(name, f'38;5;{color_num}', f'48;5;{color_num}', 
-                                 (gray_value, gray_value, gray_value), hex_color))
+RGB_CUBE_COLORS = [
+    make_color(f'Color {color_num}', f'38;5;{color_num}', f'48;5;{color_num}',
+               (rgb_r, rgb_g, rgb_b), '#' + HEX2[rgb_r] + HEX2[rgb_g] + HEX2[rgb_b])
+    for color_num, (rgb_r, rgb_g, rgb_b) in enumerate(product(CUBE_LEVELS, repeat=3), 16)
+]
+
+# Generate 24 grayscale colors (colors 232-255), values 8, 18, 28, ..., 238
+GRAYSCALE_COLORS = [
+    make_color(f'Gray {color_num}', f'38;5;{color_num}', f'48;5;{color_num}',
+               (gray_value, gray_value, gray_value), '#' + HEX2[gray_value] * 3)
+    for color_num, gray_value in enumerate(range(8, 248, 10), 232)
+]
 
 # All 256 colors
 ALL_COLORS = BASIC_COLORS + BRIGHT_COLORS + RGB_CUBE_COLORS + GRAYSCALE_COLORS
 
-def colorize(text, fg=None, bg=None, bold=False, underline=False, reverse=False):
-    """Apply ANSI color codes to text."""
-    if not ANSI_ENABLED:
-        return text
-    
-    codes = []
-    if fg:
-        codes.append(fg)
-    if bg:
-        codes.append(bg)
-    if bold:
-        codes.append('1')
-    if underline:
-        codes.append('4')
-    if reverse:
-        codes.append('7')
+# Per-field views of ALL_COLORS, indexed by color number
+(NAMES, ANSI_FG, ANSI_BG, RGB, HEX, FG_SEQ, BG_SEQ,
+ FG_ESCAPE, BG_ESCAPE) = map(tuple, zip(*ALL_COLORS))
+
+# Padded " nnn " cell labels for every palette number
+_LABEL3 = tuple(f" {i:3d} " for i in range(256))
+
+# SGR attribute codes for every bold/underline/reverse combination, indexed by
+# bold + 2 * underline + 4 * reverse
+_ATTR_CODES = ('', '1', '4', '1;4', '7', '1;7', '4;7', '1;4;7')
+
+@lru_cache(maxsize=1024)
+def _prefix(fg, bg, bold, underline, reverse):
+    """Build the escape sequence for a style combination ('' if there is none)."""
+    attrs = _ATTR_CODES[bool(bold) + 2 * bool(underline) + 4 * bool(reverse)]
+    codes = [code for code in (fg, bg, attrs) if code]
     
     if not codes:
-        return text
+        return ''
     
-    return f"{ESC}{';'.join(codes)}m{text}{RESET}"
+    return f"{ESC}{';'.join(codes)}m"
+
+# Menus, labels and status lines repeat the same (text, style) pairs, so whole
+# results are cached on top of the cached prefixes
+@lru_cache(maxsize=1024)
+def _colorize_ansi(text, fg=None, bg=None, bold=False, underline=False, reverse=False):
+    """Apply ANSI color codes to text."""
+    prefix = _prefix(fg, bg, bold, underline, reverse)
+    return prefix + text + RESET if prefix else text
+
+def _colorize_fast_ansi(text, fg_seq='', bg_seq=''):
+    """Apply precomputed escape sequences (Color.fg_seq/bg_seq) to text."""
+    return fg_seq + bg_seq + text + RESET
+
+def _colorize_identity(text, *args, **kwargs):
+    """Return text unchanged (used when the terminal has no ANSI support)."""
+    return text
+
+# Pick the implementations once instead of checking ANSI_ENABLED on every call
+colorize = _colorize_ansi if ANSI_ENABLED else _colorize_identity
+colorize_fast = _colorize_fast_ansi if ANSI_ENABLED else _colorize_identity
 
+@lru_cache(maxsize=4096)
 def rgb_to_ansi_truecolor(r, g, b, background=False):
     """Convert RGB values to 24-bit ANSI color code."""
     code = '48;2' if background else '38;2'
     return f"{code};{r};{g};{b}"
 
+def rgb_batch_to_ansi(colors, background=False):
+    """Convert a sequence of (r, g, b) triples to complete 24-bit escape sequences.
+    
+    Bulk counterpart of rgb_to_ansi_truecolor for gradients and images: one
+    sequence per color, in order, ready to be joined and written at once.
+    """
+    lead = f"{ESC}48;2;" if background else f"{ESC}38;2;"
+    return [f"{lead}{r};{g};{b}m" for r, g, b in colors]
+
+# Nearest cube index (0-5) for every channel value, and nearest grayscale
+# ramp index (0-23) for every channel average (same thresholds as tmux)
+_CUBE_INDEX = tuple(0 if v < 48 else 1 if v < 114 else (v - 35) // 40 for v in range(256))
+_GRAY_INDEX = tuple(23 if v > 238 else max(0, (v - 3) // 10) for v in range(256))
+
+def rgb_to_256(r, g, b):
+    """Convert RGB values to the nearest color number in the 256-color palette."""
+    if (r | g | b) & ~0xFF:
+        raise ValueError(f"RGB values must be between 0 and 255, got ({r}, {g}, {b})")
+    
+    # Closest color in the 6x6x6 cube
+    qr, qg, qb = _CUBE_INDEX[r], _CUBE_INDEX[g], _CUBE_INDEX[b]
+    cr, cg, cb = CUBE_LEVELS[qr], CUBE_LEVELS[qg], CUBE_LEVELS[qb]
+    cube_num = 16 + (qr * 36) + (qg * 6) + qb
+    if (cr, cg, cb) == (r, g, b):
+        return cube_num
+    
+    # Closest grayscale color; pick whichever of the two is nearer
+    gray_idx = _GRAY_INDEX[(r + g + b) // 3]
+    gray = 8 + gray_idx * 10
+    cube_dist = (cr - r) ** 2 + (cg - g) ** 2 + (cb - b) ** 2
+    gray_dist = (gray - r) ** 2 + (gray - g) ** 2 + (gray - b) ** 2
+    return 232 + gray_idx if gray_dist < cube_dist else cube_num
+
 def rgb_to_hex(r, g, b):
     """Convert RGB values to hex color code."""
-    return f"#{r:02X}{g:02X}{b:02X}"
+    if (r | g | b) & ~0xFF:
+        raise ValueError(f"RGB values must be between 0 and 255, got ({r}, {g}, {b})")
+    return '#' + HEX2[r] + HEX2[g] + HEX2[b]
+
+@contextmanager
+def use_block_buffering(buffer_size=65536):
+    """Give stdout a large write buffer for a block when it is not a terminal.
+    
+    Piped or redirected output then leaves the process in big blocks. Nothing
+    changes if unbuffered output was requested (-u / PYTHONUNBUFFERED). The
+    original stream is put back, still open, when the block ends. Use as
+    ``with use_block_buffering(): ...``; the value is True if stdout was
+    replaced.
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, 'buffer', None)
+    # Unbuffered streams (-u) have no BufferedWriter layer to build on
+    if not isinstance(buffer, io.BufferedWriter) or stream.isatty():
+        yield False
+        return
+    stream.flush()
+    # Stack the large buffer on top of the existing one rather than detaching
+    # it, so sys.__stdout__ stays usable
+    sys.stdout = io.TextIOWrapper(io.BufferedWriter(buffer, buffer_size),
+                                  encoding=stream.encoding, errors=stream.errors)
+    try:
+        yield True
+    finally:
+        block, sys.stdout = sys.stdout, stream
+        block.flush()
+        # Detach the added layers so discarding them cannot close stdout
+        block.detach().detach()
+        stream.flush()
+
+class PrintBuffer:
+    """Collect everything written to sys.stdout and emit it in one write.
+    
+    Use as ``with PrintBuffer(): ...``. Output is held until the block ends or
+    until something flushes stdout (a progress bar redraw, input()), so a whole
+    screen reaches the terminal at once instead of line by line.
+    """
+    
+    def __init__(self):
+        self._parts = []
+        self._stream = None
+    
+    def __enter__(self):
+        self._stream = sys.stdout
+        sys.stdout = self
+        return self
+    
+    def __exit__(self, *exc_info):
+        sys.stdout = self._stream
+        self.flush()
+    
+    def write(self, text):
+        self._parts.append(text)
+        return len(text)
+    
+    def flush(self):
+        if self._parts:
+            self._stream.write(''.join(self._parts))
+            self._parts.clear()
+        self._stream.flush()
+    
+    def __getattr__(self, name):
+        # Anything else (encoding, isatty, fileno, ...) comes from the real stream
+        return getattr(self._stream, name)
+
+def press_any_key(prompt="\nPress any key to continue..."):
+    """Show prompt and wait for a single key press.
+    
+    On a terminal one key is read in cbreak mode, without waiting for Enter or
+    going through readline; otherwise (piped input) a whole line is read.
+    """
+    if not sys.stdin.isatty():
+        input(prompt)
+        return
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getwch()
+        if key == '\x03':  # Ctrl+C is returned as a key here
+            raise KeyboardInterrupt
+        if key in ('\x00', '\xe0'):  # Arrows and function keys send a second code
+            msvcrt.getwch()
+    else:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            # Read past the buffered text layer, and take a whole multi-byte
+            # key (arrows, function keys) so nothing is left for the next read
+            os.read(fd, 32)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    # The key is not echoed; end the prompt line as input() would
+    sys.stdout.write("\n")
+
+# Begin/end synchronized update (DEC private mode 2026): the terminal holds the
+# screen until the end marker and then paints everything in between at once
+SYNC_BEGIN = '\033[?2026h'
+SYNC_END = '\033[?2026l'
+
+@contextmanager
+def synchronized_output():
+    """Have the terminal paint everything written inside the block as one frame.
+    
+    Terminals without mode 2026 ignore the markers; nothing is emitted when
+    ANSI is unavailable.
+    """
+    if not ANSI_ENABLED:
+        yield
+        return
+    sys.stdout.write(SYNC_BEGIN)
+    try:
+        yield
+    finally:
+        sys.stdout.write(SYNC_END)
+        sys.stdout.flush()
+
+@lru_cache(maxsize=32)
+def _render_header(title, width=80):
+    """Render a header block; the menus redraw the same few titles over and over."""
+    rule = "=" * width
+    return f"\n{rule}\n{title:^{width}}\n{rule}\n"
 
 def print_header(title):
     """Print a formatted header."""
-    width = 80
-    print("\n" + "=" * width)
-    print(f"{title:^{width}}")
-    print("=" * width)
+    sys.stdout.write(_render_header(title))
 
 def print_basic_colors():
     """Display the 16 basic colors (8 standard + 8 bright)."""
     print_header("Basic 16 Colors (Standard + Bright)")
     
     # Print column headers
-    print("\nColor Name".ljust(20), "FG Code".ljust(10), "BG Code".ljust(10), 
-          "RGB".ljust(15), "Hex".ljust(10), "Sample".ljust(20))
+    print(f"\n{'Color Name':<19} {'FG Code':<10} {'BG Code':<10} "
+          f"{'RGB':<15} {'Hex':<10} {'Sample':<20}")
     print("-" * 80)
     
     # Print standard colors
     for color in BASIC_COLORS + BRIGHT_COLORS:
-        fg_sample = colorize("Text", color.ansi_fg)
-        bg_sample = colorize("Text", None, color.ansi_bg)
+        fg_sample = colorize_fast("Text", color.fg_seq)
+        bg_sample = colorize_fast("Text", bg_seq=color.bg_seq)
         rgb_str = f"({color.rgb[0]}, {color.rgb[1]}, {color.rgb[2]})"
         
-        print(f"{color.name.ljust(20)} "
-              f"{('\\033[' + color.ansi_fg + 'm').ljust(10)} "
-              f"{('\\033[' + color.ansi_bg + 'm').ljust(10)} "
-              f"{rgb_str.ljust(15)} "
-              f"{color.hex.ljust(10)} "
-              f"{fg_sample} {bg_sample}")
+        print(f"{color.name:<20} {color.fg_escape:<10} {color.bg_escape:<10} "
+              f"{rgb_str:<15} {color.hex:<10} {fg_sample} {bg_sample}")
 
 def print_color_grid(colors, title, columns=8):
     """Print a grid of colors with their information."""
     print_header(title)
     
+    out = []
     for i, color in enumerate(colors):
         if i % columns == 0:
-            print()
+            out.append("\n")
         
-        # Print color block and number
-        bg_color = colorize(f" {i+16:3d} ", None, color.ansi_bg)
-        print(f"{bg_color}", end=" ")
+        # Color block and number (the label table only covers the 256 palette numbers)
+        n = i + 16
+        label = _LABEL3[n] if n < 256 else f" {n:3d} "
+        out.append(colorize_fast(label, bg_seq=color.bg_seq) + " ")
         
-        # Print newline after last column
+        # Newline after last column
         if (i + 1) % columns == 0 or i == len(colors) - 1:
-            print()
-
-def print_extended_colors():
-    """Display the extended 256-color palette."""
-    print_header("Extended 256-Color Palette")
-    
-    # Print 16 basic colors
-    print("\n--- Basic 16 Colors (0-15) ---")
-    for i, color in enumerate(BASIC_COLORS + BRIGHT_COLORS):
+            out.append("\n")
+    sys.stdout.write(''.join(out))
+
+def _build_extended_blocks():
+    """Render the basic, RGB cube and grayscale blocks of the 256-color palette."""
+    # 16 basic colors
+    basic = []
+    for i in range(16):
         if i % 8 == 0:
-            print()
-        bg_color = colorize(f" {i:3d} ", None, color.ansi_bg)
-        print(f"{bg_color}", end=" ")
+            basic.append("\n")
+        basic.append(colorize_fast(_LABEL3[i], bg_seq=BG_SEQ[i]) + " ")
         if (i + 1) % 8 == 0:
-            print()
+            basic.append("\n")
     
-    # Print 6x6x6 RGB cube (216 colors)
-    print("\n\n--- 6x6x6 RGB Cube (16-231) ---")
-    # Print in a more organized way to show the cube structure
+    # 6x6x6 RGB cube (216 colors), laid out to show the cube structure
+    cube = []
     for r in range(6):
         for g_block in range(3):  # Split into 2 rows for better display
-            print()
+            cube.append("\n")
             for g in range(2):
                 g_val = g + g_block * 2
                 for b in range(6):
                     color_num = 16 + (r * 36) + (g_val * 6) + b
-                    color = RGB_CUBE_COLORS[color_num - 16]
-                    bg_color = colorize(f" {color_num:3d} ", None, color.ansi_bg)
-                    print(f"{bg_color}", end=" ")
-                print("  ", end="")  # Separate the two g-value groups
-            print()
-        print()  # Extra line between r-value groups
-    
-    # Print grayscale colors
-    print("\n--- Grayscale (232-255) ---")
-    for i, color in enumerate(GRAYSCALE_COLORS):
-        if i % 8 == 0:
-            print()
-        color_num = 232 + i
-        bg_color = colorize(f" {color_num:3d} ", None, color.ansi_bg)
-        print(f"{bg_color}", end=" ")
-        if (i + 1) % 8 == 0 or i == len(GRAYSCALE_COLORS) - 1:
-            print()
+                    cube.append(colorize_fast(_LABEL3[color_num], bg_seq=BG_SEQ[color_num]) + " ")
+                cube.append("  ")  # Separate the two g-value groups
+            cube.append("\n")
+        cube.append("\n")  # Extra line between r-value groups
+    
+    # Grayscale colors
+    gray = []
+    for color_num in range(232, 256):
+        if color_num % 8 == 0:
+            gray.append("\n")
+        gray.append(colorize_fast(_LABEL3[color_num], bg_seq=BG_SEQ[color_num]) + " ")
+        if (color_num + 1) % 8 == 0:
+            gray.append("\n")
+    
+    return ''.join(basic), ''.join(cube), ''.join(gray)
+
+# The palette never changes, so the blocks are rendered once at import
+_BASIC16_BLOCK, _CUBE_BLOCK, _GRAYSCALE_BLOCK = _build_extended_blocks()
+
+def print_extended_colors():
+    """Display the extended 256-color palette."""
+    print_header("Extended 256-Color Palette")
+    sys.stdout.write("\n--- Basic 16 Colors (0-15) ---\n" + _BASIC16_BLOCK
+                     + "\n\n--- 6x6x6 RGB Cube (16-231) ---\n" + _CUBE_BLOCK
+                     + "\n--- Grayscale (232-255) ---\n" + _GRAYSCALE_BLOCK)
 
 def print_color_details(color_num):
     """Print detailed information about a specific color."""
-    if 0 <= color_num < 16:
-        color = (BASIC_COLORS + BRIGHT_COLORS)[color_num]
-    elif 16 <= color_num < 232:
-        color = RGB_CUBE_COLORS[color_num - 16]
-    elif 232 <= color_num < 256:
-        color = GRAYSCALE_COLORS[color_num - 232]
-    else:
+    if not 0 <= color_num < 256:
         print(f"Invalid color number: {color_num}")
         return
+    # ALL_COLORS is in palette order, so the color number is the index
+    color = ALL_COLORS[color_num]
     
     print_header(f"Color {color_num}: {color.name}")
     print(f"\nANSI Codes:")
-    print(f"  Foreground: \\033[{color.ansi_fg}m")
-    print(f"  Background: \\033[{color.ansi_bg}m")
+    print(f"  Foreground: {color.fg_escape}")
+    print(f"  Background: {color.bg_escape}")
     print(f"\nRGB Values: {color.rgb}")
     print(f"Hex Code: {color.hex}")
     
@@ -253,82 +455,83 @@ def print_color_details(color_num):
     
     # Show combinations with other colors
     print("\nCombinations with other colors:")
-    for i, other in enumerate([0, 7, 15, 226, 21, 201, 46, 231]):  # Selected contrasting colors
-        other_color = ALL_COLORS[other] if other < len(ALL_COLORS) else BASIC_COLORS[0]
+    for other in [0, 7, 15, 226, 21, 201, 46, 231]:  # Selected contrasting colors
         print(f"  With color {other}: "
-              f"{colorize('Text', color.ansi_fg, other_color.ansi_bg)} "
-              f"{colorize('Text', other_color.ansi_fg, color.ansi_bg)}")
+              f"{colorize('Text', ANSI_FG[color_num], ANSI_BG[other])} "
+              f"{colorize('Text', ANSI_FG[other], ANSI_BG[color_num])}")
+
+def _hue_to_rgb(hue):
+    """Convert a hue in degrees to RGB (simplified HSV with S=V=1)."""
+    h = hue / 60
+    sector = int(h)
+    frac = h - sector
+    
+    if sector == 0:
+        return 255, int(255 * frac), 0
+    elif sector == 1:
+        return int(255 * (1 - frac)), 255, 0
+    elif sector == 2:
+        return 0, 255, int(255 * frac)
+    elif sector == 3:
+        return 0, int(255 * (1 - frac)), 255
+    elif sector == 4:
+        return int(255 * frac), 0, 255
+    else:
+        return 255, 0, int(255 * (1 - frac))
+
+# Rainbow steps shown by print_truecolor_samples: (label, background code) every 20°
+_RAINBOW = tuple(
+    (f" {hue:3d}° ", rgb_to_ansi_truecolor(*_hue_to_rgb(hue), background=True))
+    for hue in range(0, 360, 20)
+)
 
 def print_truecolor_samples():
     """Display samples of 24-bit true color."""
     print_header("24-bit True Color Samples")
-    
-    print("\nGradients:")
+    out = ["\nGradients:\n"]
     
     # Red gradient
-    print("\nRed Gradient:")
+    out.append("\nRed Gradient:\n")
     for i in range(0, 256, 16):
-        bg_color = rgb_to_ansi_truecolor(i, 0, 0, background=True)
-        print(colorize(f" {i:3d} ", bg_color), end=" ")
-    print()
+        out.append(colorize_fast(_LABEL3[i], bg_seq=f"{ESC}48;2;{i};0;0m") + " ")
+    out.append("\n")
     
     # Green gradient
-    print("\nGreen Gradient:")
+    out.append("\nGreen Gradient:\n")
     for i in range(0, 256, 16):
-        bg_color = rgb_to_ansi_truecolor(0, i, 0, background=True)
-        print(colorize(f" {i:3d} ", bg_color), end=" ")
-    print()
+        out.append(colorize_fast(_LABEL3[i], bg_seq=f"{ESC}48;2;0;{i};0m") + " ")
+    out.append("\n")
     
     # Blue gradient
-    print("\nBlue Gradient:")
+    out.append("\nBlue Gradient:\n")
     for i in range(0, 256, 16):
-        bg_color = rgb_to_ansi_truecolor(0, 0, i, background=True)
-        print(colorize(f" {i:3d} ", bg_color), end=" ")
-    print()
+        out.append(colorize_fast(_LABEL3[i], bg_seq=f"{ESC}48;2;0;0;{i}m") + " ")
+    out.append("\n")
     
     # Gray gradient
-    print("\nGray Gradient:")
+    out.append("\nGray Gradient:\n")
     for i in range(0, 256, 16):
-        bg_color = rgb_to_ansi_truecolor(i, i, i, background=True)
-        print(colorize(f" {i:3d} ", bg_color), end=" ")
-    print()
+        out.append(colorize_fast(_LABEL3[i], bg_seq=f"{ESC}48;2;{i};{i};{i}m") + " ")
+    out.append("\n")
     
     # Rainbow
-    print("\nRainbow:")
-    for i in range(0, 360, 20):
-        # Convert HSV to RGB (simplified, with S=V=1)
-        h = i / 60
-        sector = int(h)
-        frac = h - sector
-        
-        if sector == 0:
-            r, g, b = 255, int(255 * frac), 0
-        elif sector == 1:
-            r, g, b = int(255 * (1 - frac)), 255, 0
-        elif sector == 2:
-            r, g, b = 0, 255, int(255 * frac)
-        elif sector == 3:
-            r, g, b = 0, int(255 * (1 - frac)), 255
-        elif sector == 4:
-            r, g, b = int(255 * frac), 0, 255
-        else:
-            r, g, b = 255, 0, int(255 * (1 - frac))
-        
-        bg_color = rgb_to_ansi_truecolor(r, g, b, background=True)
-        print(colorize(f" {i:3d}° ", bg_color), end=" ")
-    print()
+    out.append("\nRainbow:\n")
+    for label, bg_color in _RAINBOW:
+        out.append(colorize_fast(label, bg_seq=f"{ESC}{bg_color}m") + " ")
+    out.append("\n")
     
     # Small color matrix
-    print("\nColor Matrix (Red × Green, Blue=128):")
+    out.append("\nColor Matrix (Red × Green, Blue=128):\n")
     size = 8  # 8×8 matrix
     for r in range(size):
-        print()
+        out.append("\n")
         r_val = int(r * 255 / (size - 1))
         for g in range(size):
             g_val = int(g * 255 / (size - 1))
-            bg_color = rgb_to_ansi_truecolor(r_val, g_val, 128, background=True)
-            print(colorize("  ", bg_color), end="")
-    print()
+            out.append(colorize_fast("  ", bg_seq=f"{ESC}48;2;{r_val};{g_val};128m"))
+    out.append("\n")
+    
+    sys.stdout.write(''.join(out))
 
 def print_code_examples():
     """Display code examples for using ANSI colors in Python."""
@@ -457,6 +660,33 @@ print(colorize("RGB background", None, (0, 128, 255)))
 print(colorize("Bold underlined text", "32", bold=True, underline=True))
 """)
 
+@lru_cache(maxsize=512)
+def _resolve_spec(spec, is_bg):
+    """Resolve a color spec (0-255 or r,g,b) to (ansi_code, description)."""
+    label = 'Background' if is_bg else 'Foreground'
+    
+    if ',' in spec:  # RGB format
+        try:
+            r, g, b = map(int, spec.split(','))
+        except ValueError:
+            return None, f"Invalid RGB format for {label.lower()}: {spec}"
+        if (r | g | b) & ~0xFF:
+            return None, f"RGB values for {label.lower()} must be between 0 and 255: {spec}"
+        nearest = rgb_to_256(r, g, b)
+        return (rgb_to_ansi_truecolor(r, g, b, background=is_bg),
+                f"{label}: RGB({r},{g},{b}) - Hex: {rgb_to_hex(r, g, b)}"
+                f" - Nearest 256-color: {nearest}")
+    
+    # Color number
+    try:
+        color_num = int(spec)
+    except ValueError:
+        return None, f"Invalid color specification for {label.lower()}: {spec}"
+    if not 0 <= color_num < len(ALL_COLORS):
+        return None, f"Invalid color number for {label.lower()}: {color_num}"
+    color = ALL_COLORS[color_num]
+    return (color.ansi_bg if is_bg else color.ansi_fg), f"{label}: Color {color_num} - {color.name}"
+
 def preview_colors(fg_color=None, bg_color=None, text="Hello, ANSI colors!"):
     """Preview text with specified foreground and background colors."""
     print_header("Color Preview")
@@ -487,42 +717,12 @@ def preview_colors(fg_color=None, bg_color=None, text="Hello, ANSI colors!"):
     bg_code = None
     
     if fg_color:
-        if ',' in fg_color:  # RGB format
-            try:
-                r, g, b = map(int, fg_color.split(','))
-                fg_code = rgb_to_ansi_truecolor(r, g, b)
-                print(f"\nForeground: RGB({r},{g},{b}) - Hex: {rgb_to_hex(r, g, b)}")
-            except ValueError:
-                print(f"Invalid RGB format for foreground: {fg_color}")
-        else:  # Color number
-            try:
-                color_num = int(fg_color)
-                if 0 <= color_num < len(ALL_COLORS):
-                    fg_code = ALL_COLORS[color_num].ansi_fg
-                    print(f"\nForeground: Color {color_num} - {ALL_COLORS[color_num].name}")
-                else:
-                    print(f"Invalid color number for foreground: {color_num}")
-            except ValueError:
-                print(f"Invalid color specification for foreground: {fg_color}")
+        fg_code, description = _resolve_spec(str(fg_color), False)
+        print(f"\n{description}" if fg_code else description)
     
     if bg_color:
-        if ',' in bg_color:  # RGB format
-            try:
-                r, g, b = map(int, bg_color.split(','))
-                bg_code = rgb_to_ansi_truecolor(r, g, b, background=True)
-                print(f"Background: RGB({r},{g},{b}) - Hex: {rgb_to_hex(r, g, b)}")
-            except ValueError:
-                print(f"Invalid RGB format for background: {bg_color}")
-        else:  # Color number
-            try:
-                color_num = int(bg_color)
-                if 0 <= color_num < len(ALL_COLORS):
-                    bg_code = ALL_COLORS[color_num].ansi_bg
-                    print(f"Background: Color {color_num} - {ALL_COLORS[color_num].name}")
-                else:
-                    print(f"Invalid color number for background: {color_num}")
-            except ValueError:
-                print(f"Invalid color specification for background: {bg_color}")
+        bg_code, description = _resolve_spec(str(bg_color), True)
+        print(description)
     
     print("\nPreview:")
     print(colorize(text, fg_code, bg_code))
@@ -539,6 +739,14 @@ def preview_colors(fg_color=None, bg_color=None, text="Hello, ANSI colors!"):
         bg_part = f"\\033[{bg_code}m" if bg_code else ""
         print(f'print("{fg_part}{bg_part}{text}\\033[0m")')
 
+# Command line options and the argument each one sets
+OPTIONS = {
+    '--mode': 'mode',
+    '--fg': 'fg',
+    '--bg': 'bg',
+    '--text': 'text',
+}
+
 def parse_args():
     """Parse command line arguments."""
     args = {
@@ -552,14 +760,9 @@ def parse_args():
         if arg == '--help':
             print(__doc__)
             sys.exit(0)
-        elif arg.startswith('--mode='):
-            args['mode'] = arg[7:]
-        elif arg.startswith('--fg='):
-            args['fg'] = arg[5:]
-        elif arg.startswith('--bg='):
-            args['bg'] = arg[5:]
-        elif arg.startswith('--text='):
-            args['text'] = arg[7:]
+        option, sep, value = arg.partition('=')
+        if sep and option in OPTIONS:
+            args[OPTIONS[option]] = value
     
     return args
 
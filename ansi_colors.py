@@ -17,25 +17,26 @@ Usage:
 """
 
 import os
+import re
 import sys
-import ctypes
-from functools import wraps
+from functools import cache, wraps
 
 # Enable ANSI escapes on Windows consoles
 def enable_windows_ansi():
     """Enable ANSI escape sequences on Windows."""
-    if os.name == 'nt':
-        try:
-            k32 = ctypes.windll.kernel32
-            h = k32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
-            mode = ctypes.c_ulong()
-            if k32.GetConsoleMode(h, ctypes.byref(mode)):
-                # ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
-                k32.SetConsoleMode(h, mode.value | 0x0004)
-                return True
-        except Exception:
-            pass
-    return os.name != 'nt'  # True if not Windows (likely supports ANSI)
+    if os.name != 'nt':
+        return True  # Not Windows (likely supports ANSI)
+    try:
+        import ctypes  # Only needed (and only loaded) on Windows
+        k32 = ctypes.windll.kernel32
+        h = k32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not k32.GetConsoleMode(h, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        return bool(k32.SetConsoleMode(h, mode.value | 0x0004))
+    except Exception:
+        return False
 
 # Call this at startup
 ANSI_ENABLED = enable_windows_ansi()
@@ -106,86 +107,180 @@ def colorize(text, *args):
     Returns:
         The colorized text string
     """
-    if not ANSI_ENABLED or not args:
+    if not args:
         return text
     
-    return ''.join(args) + text + RESET
+    if len(args) == 1:
+        return f"{args[0]}{text}{RESET}"
+    return f"{''.join(args)}{text}{RESET}"
+
+if ANSI_ENABLED:
+    def _make_wrapper(name, code):
+        """Build a single-code wrapper such as red() or bold()."""
+        # The escape prefix and RESET are bound as default arguments so the
+        # wrapper is one concatenation and never goes through colorize()
+        def wrapper(text, _p=code, _r=RESET): return _p + text + _r
+        wrapper.__name__ = wrapper.__qualname__ = name
+        return wrapper
+else:
+    # Without ANSI support every colorizer is a pass-through; decide that once
+    # here rather than checking ANSI_ENABLED on every call
+    def colorize(text, *args): return text
+    
+    def _make_wrapper(name, code):
+        """Build a pass-through wrapper that still carries its own name."""
+        def wrapper(text): return text
+        wrapper.__name__ = wrapper.__qualname__ = name
+        return wrapper
 
 # Basic color functions
-def black(text): return colorize(text, BLACK)
-def red(text): return colorize(text, RED)
-def green(text): return colorize(text, GREEN)
-def yellow(text): return colorize(text, YELLOW)
-def blue(text): return colorize(text, BLUE)
-def magenta(text): return colorize(text, MAGENTA)
-def cyan(text): return colorize(text, CYAN)
-def white(text): return colorize(text, WHITE)
+black = _make_wrapper('black', BLACK)
+red = _make_wrapper('red', RED)
+green = _make_wrapper('green', GREEN)
+yellow = _make_wrapper('yellow', YELLOW)
+blue = _make_wrapper('blue', BLUE)
+magenta = _make_wrapper('magenta', MAGENTA)
+cyan = _make_wrapper('cyan', CYAN)
+white = _make_wrapper('white', WHITE)
 
 # Bright color functions
-def bright_black(text): return colorize(text, BRIGHT_BLACK)
-def bright_red(text): return colorize(text, BRIGHT_RED)
-def bright_green(text): return colorize(text, BRIGHT_GREEN)
-def bright_yellow(text): return colorize(text, BRIGHT_YELLOW)
-def bright_blue(text): return colorize(text, BRIGHT_BLUE)
-def bright_magenta(text): return colorize(text, BRIGHT_MAGENTA)
-def bright_cyan(text): return colorize(text, BRIGHT_CYAN)
-def bright_white(text): return colorize(text, BRIGHT_WHITE)
+bright_black = _make_wrapper('bright_black', BRIGHT_BLACK)
+bright_red = _make_wrapper('bright_red', BRIGHT_RED)
+bright_green = _make_wrapper('bright_green', BRIGHT_GREEN)
+bright_yellow = _make_wrapper('bright_yellow', BRIGHT_YELLOW)
+bright_blue = _make_wrapper('bright_blue', BRIGHT_BLUE)
+bright_magenta = _make_wrapper('bright_magenta', BRIGHT_MAGENTA)
+bright_cyan = _make_wrapper('bright_cyan', BRIGHT_CYAN)
+bright_white = _make_wrapper('bright_white', BRIGHT_WHITE)
 
 # Background color functions
-def bg_black(text): return colorize(text, BG_BLACK)
-def bg_red(text): return colorize(text, BG_RED)
-def bg_green(text): return colorize(text, BG_GREEN)
-def bg_yellow(text): return colorize(text, BG_YELLOW)
-def bg_blue(text): return colorize(text, BG_BLUE)
-def bg_magenta(text): return colorize(text, BG_MAGENTA)
-def bg_cyan(text): return colorize(text, BG_CYAN)
-def bg_white(text): return colorize(text, BG_WHITE)
+bg_black = _make_wrapper('bg_black', BG_BLACK)
+bg_red = _make_wrapper('bg_red', BG_RED)
+bg_green = _make_wrapper('bg_green', BG_GREEN)
+bg_yellow = _make_wrapper('bg_yellow', BG_YELLOW)
+bg_blue = _make_wrapper('bg_blue', BG_BLUE)
+bg_magenta = _make_wrapper('bg_magenta', BG_MAGENTA)
+bg_cyan = _make_wrapper('bg_cyan', BG_CYAN)
+bg_white = _make_wrapper('bg_white', BG_WHITE)
 
 # Bright background color functions
-def bg_bright_black(text): return colorize(text, BG_BRIGHT_BLACK)
-def bg_bright_red(text): return colorize(text, BG_BRIGHT_RED)
-def bg_bright_green(text): return colorize(text, BG_BRIGHT_GREEN)
-def bg_bright_yellow(text): return colorize(text, BG_BRIGHT_YELLOW)
-def bg_bright_blue(text): return colorize(text, BG_BRIGHT_BLUE)
-def bg_bright_magenta(text): return colorize(text, BG_BRIGHT_MAGENTA)
-def bg_bright_cyan(text): return colorize(text, BG_BRIGHT_CYAN)
-def bg_bright_white(text): return colorize(text, BG_BRIGHT_WHITE)
+bg_bright_black = _make_wrapper('bg_bright_black', BG_BRIGHT_BLACK)
+bg_bright_red = _make_wrapper('bg_bright_red', BG_BRIGHT_RED)
+bg_bright_green = _make_wrapper('bg_bright_green', BG_BRIGHT_GREEN)
+bg_bright_yellow = _make_wrapper('bg_bright_yellow', BG_BRIGHT_YELLOW)
+bg_bright_blue = _make_wrapper('bg_bright_blue', BG_BRIGHT_BLUE)
+bg_bright_magenta = _make_wrapper('bg_bright_magenta', BG_BRIGHT_MAGENTA)
+bg_bright_cyan = _make_wrapper('bg_bright_cyan', BG_BRIGHT_CYAN)
+bg_bright_white = _make_wrapper('bg_bright_white', BG_BRIGHT_WHITE)
 
 # Style functions
-def bold(text): return colorize(text, BOLD)
-def dim(text): return colorize(text, DIM)
-def italic(text): return colorize(text, ITALIC)
-def underline(text): return colorize(text, UNDERLINE)
-def blink(text): return colorize(text, BLINK)
-def reverse(text): return colorize(text, REVERSE)
-def hidden(text): return colorize(text, HIDDEN)
-def strikethrough(text): return colorize(text, STRIKETHROUGH)
+bold = _make_wrapper('bold', BOLD)
+dim = _make_wrapper('dim', DIM)
+italic = _make_wrapper('italic', ITALIC)
+underline = _make_wrapper('underline', UNDERLINE)
+blink = _make_wrapper('blink', BLINK)
+reverse = _make_wrapper('reverse', REVERSE)
+hidden = _make_wrapper('hidden', HIDDEN)
+strikethrough = _make_wrapper('strikethrough', STRIKETHROUGH)
+
+# Cached escape prefixes for palette and RGB colors
+@cache
+def _fg256(n): return f'{ESC}38;5;{n}m'
+@cache
+def _bg256(n): return f'{ESC}48;5;{n}m'
+@cache
+def _rgb_fg(r, g, b): return f'{ESC}38;2;{r};{g};{b}m'
+@cache
+def _rgb_bg(r, g, b): return f'{ESC}48;2;{r};{g};{b}m'
 
 # 256-color functions
 def color256(n, text):
     """Apply a color from the 256-color palette."""
     if not 0 <= n <= 255:
         raise ValueError(f"Color index must be between 0 and 255, got {n}")
-    return colorize(text, f'{ESC}38;5;{n}m')
+    return f"{_fg256(n)}{text}{RESET}"
 
 def bg_color256(n, text):
     """Apply a background color from the 256-color palette."""
     if not 0 <= n <= 255:
         raise ValueError(f"Color index must be between 0 and 255, got {n}")
-    return colorize(text, f'{ESC}48;5;{n}m')
+    return f"{_bg256(n)}{text}{RESET}"
 
 # RGB color functions
 def rgb(r, g, b, text):
     """Apply an RGB foreground color."""
-    if not all(0 <= c <= 255 for c in (r, g, b)):
+    if (r | g | b) & ~0xFF:  # Any channel outside 0-255 (negatives included)
         raise ValueError(f"RGB values must be between 0 and 255, got ({r}, {g}, {b})")
-    return colorize(text, f'{ESC}38;2;{r};{g};{b}m')
+    return f"{_rgb_fg(r, g, b)}{text}{RESET}"
 
 def bg_rgb(r, g, b, text):
     """Apply an RGB background color."""
-    if not all(0 <= c <= 255 for c in (r, g, b)):
+    if (r | g | b) & ~0xFF:  # Any channel outside 0-255 (negatives included)
         raise ValueError(f"RGB values must be between 0 and 255, got ({r}, {g}, {b})")
-    return colorize(text, f'{ESC}48;2;{r};{g};{b}m')
+    return f"{_rgb_bg(r, g, b)}{text}{RESET}"
+
+# Unvalidated RGB variants for channel values already known to be in range
+# (e.g. taken from a fixed palette); out-of-range input yields a bad sequence
+def rgb_unchecked(r, g, b, text):
+    """Apply an RGB foreground color without range-checking r, g, b."""
+    return f"{_rgb_fg(r, g, b)}{text}{RESET}"
+
+def bg_rgb_unchecked(r, g, b, text):
+    """Apply an RGB background color without range-checking r, g, b."""
+    return f"{_rgb_bg(r, g, b)}{text}{RESET}"
+
+if not ANSI_ENABLED:
+    # Pass-through versions, chosen once at import like colorize(); the range
+    # checks stay so bad input fails the same way on every terminal
+    def color256(n, text):
+        """Apply a color from the 256-color palette."""
+        if not 0 <= n <= 255:
+            raise ValueError(f"Color index must be between 0 and 255, got {n}")
+        return text
+    
+    def bg_color256(n, text):
+        """Apply a background color from the 256-color palette."""
+        if not 0 <= n <= 255:
+            raise ValueError(f"Color index must be between 0 and 255, got {n}")
+        return text
+    
+    def rgb(r, g, b, text):
+        """Apply an RGB foreground color."""
+        if (r | g | b) & ~0xFF:
+            raise ValueError(f"RGB values must be between 0 and 255, got ({r}, {g}, {b})")
+        return text
+    
+    def bg_rgb(r, g, b, text):
+        """Apply an RGB background color."""
+        if (r | g | b) & ~0xFF:
+            raise ValueError(f"RGB values must be between 0 and 255, got ({r}, {g}, {b})")
+        return text
+    
+    def rgb_unchecked(r, g, b, text):
+        """Apply an RGB foreground color without range-checking r, g, b."""
+        return text
+    
+    def bg_rgb_unchecked(r, g, b, text):
+        """Apply an RGB background color without range-checking r, g, b."""
+        return text
+
+# Escape code behind each wrapper, so style() can merge them into one prefix
+_FUNC_TO_CODE = {
+    black: BLACK, red: RED, green: GREEN, yellow: YELLOW,
+    blue: BLUE, magenta: MAGENTA, cyan: CYAN, white: WHITE,
+    bright_black: BRIGHT_BLACK, bright_red: BRIGHT_RED,
+    bright_green: BRIGHT_GREEN, bright_yellow: BRIGHT_YELLOW,
+    bright_blue: BRIGHT_BLUE, bright_magenta: BRIGHT_MAGENTA,
+    bright_cyan: BRIGHT_CYAN, bright_white: BRIGHT_WHITE,
+    bg_black: BG_BLACK, bg_red: BG_RED, bg_green: BG_GREEN, bg_yellow: BG_YELLOW,
+    bg_blue: BG_BLUE, bg_magenta: BG_MAGENTA, bg_cyan: BG_CYAN, bg_white: BG_WHITE,
+    bg_bright_black: BG_BRIGHT_BLACK, bg_bright_red: BG_BRIGHT_RED,
+    bg_bright_green: BG_BRIGHT_GREEN, bg_bright_yellow: BG_BRIGHT_YELLOW,
+    bg_bright_blue: BG_BRIGHT_BLUE, bg_bright_magenta: BG_BRIGHT_MAGENTA,
+    bg_bright_cyan: BG_BRIGHT_CYAN, bg_bright_white: BG_BRIGHT_WHITE,
+    bold: BOLD, dim: DIM, italic: ITALIC, underline: UNDERLINE,
+    blink: BLINK, reverse: REVERSE, hidden: HIDDEN, strikethrough: STRIKETHROUGH,
+}
 
 # Composite functions for combining styles
 def style(text, fg=None, bg=None, bold_=False, underline_=False, reverse_=False):
@@ -202,41 +297,30 @@ def style(text, fg=None, bg=None, bold_=False, underline_=False, reverse_=False)
     Returns:
         The styled text
     """
-    # Start with the text
-    result = text
-    
-    # Apply foreground color if provided
-    if fg:
-        if callable(fg):
-            # If fg is a function (like red, green, etc.)
-            result = fg(result)
-        else:
-            # If fg is a color code string
-            result = colorize(result, fg)
-    
-    # Apply background color if provided
-    if bg:
-        if callable(bg):
-            # If bg is a function (like bg_red, bg_green, etc.)
-            result = bg(result)
+    codes = []
+    for color in (fg, bg):
+        if not color:
+            continue
+        if callable(color) and color not in _FUNC_TO_CODE:
+            # Arbitrary formatting function: apply it to the text itself
+            text = color(text)
         else:
-            # If bg is a color code string
-            result = colorize(result, bg)
+            # Color code string, or one of the wrappers above (red, bg_blue, ...)
+            codes.append(_FUNC_TO_CODE.get(color, color))
     
-    # Apply other styles
     if bold_:
-        result = bold(result)
+        codes.append(BOLD)
     if underline_:
-        result = underline(result)
+        codes.append(UNDERLINE)
     if reverse_:
-        result = reverse(result)
+        codes.append(REVERSE)
     
-    return result
+    # One combined prefix and a single RESET instead of nested wrapping
+    return colorize(text, *codes)
 
 # Function decorators for styling function output
 def colored_output(color_func):
     """Decorator to apply a color function to the output of another function."""
-    @wraps(color_func)
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -253,33 +337,36 @@ def colored_output(color_func):
 #     return "An error occurred"
 
 # Utility functions
-def strip_ansi(text):
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+def strip_ansi(text, _sub=_ANSI_ESCAPE_RE.sub):
     """Remove ANSI escape sequences from a string."""
-    import re
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    return _sub('', text)
 
 def supports_color():
     """Check if the current terminal supports color."""
     return ANSI_ENABLED
 
-def print_color_table():
+_BASIC_FUNCS = (black, red, green, yellow, blue, magenta, cyan, white)
+_BRIGHT_FUNCS = (bright_black, bright_red, bright_green, bright_yellow,
+                 bright_blue, bright_magenta, bright_cyan, bright_white)
+
+def print_color_table(_basic=_BASIC_FUNCS, _bright=_BRIGHT_FUNCS):
     """Print a table of available colors."""
     print("Basic colors (30-37):")
-    for i, func in enumerate([black, red, green, yellow, blue, magenta, cyan, white], 30):
+    for i, func in enumerate(_basic, 30):
         print(f"{i}: {func(f'Color {i}')}")
     
     print("\nBright colors (90-97):")
-    for i, func in enumerate([bright_black, bright_red, bright_green, bright_yellow, 
-                             bright_blue, bright_magenta, bright_cyan, bright_white], 90):
+    for i, func in enumerate(_bright, 90):
         print(f"{i}: {func(f'Color {i}')}")
     
-    print("\nSample 256-color palette:")
+    out = ["\nSample 256-color palette:\n"]
     for i in range(0, 256, 16):
-        for j in range(16):
-            if i + j < 256:
-                print(color256(i + j, f"{i+j:3d}"), end=" ")
-        print()
+        for n in range(i, i + 16):
+            out.append(f"{color256(n, f'{n:3d}')} ")
+        out.append("\n")
+    sys.stdout.write(''.join(out))
 
 if __name__ == "__main__":
     # Show examples when run directly
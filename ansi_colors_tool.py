@@ -24,8 +24,7 @@ Examples:
 
 import os
 import sys
-import importlib.util
-import subprocess
+import runpy
 
 def show_help():
     """Show the help message."""
@@ -44,17 +43,19 @@ def run_module(module_name, args=None):
         print(f"Error: Module '{module_name}' not found at {module_path}")
         return False
     
-    # Run the module as a script
-    cmd = [sys.executable, module_path]
-    if args:
-        cmd.extend(args)
-    
+    # Run the module as a script in this interpreter
+    saved_argv = sys.argv
+    sys.argv = [module_path] + (args or [])
     try:
-        subprocess.run(cmd, check=True)
+        runpy.run_path(module_path, run_name='__main__')
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error running {module_name}: {e}")
+    except SystemExit as e:
+        if e.code in (None, 0):
+            return True
+        print(f"Error running {module_name}: exit status {e.code}")
         return False
+    finally:
+        sys.argv = saved_argv
 
 def main():
     """Main function."""
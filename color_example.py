@@ -16,6 +16,7 @@ It includes examples of:
 import os
 import sys
 import time
+import bisect
 import random
 from datetime import datetime
 
@@ -38,7 +39,7 @@ try:
         color256, bg_color256, rgb, bg_rgb,
         
         # Utility functions
-        style, strip_ansi
+        style, strip_ansi, supports_color
     )
 except ImportError:
     # Fall back to direct import (when run as a script)
@@ -62,31 +63,34 @@ except ImportError:
         color256, bg_color256, rgb, bg_rgb,
         
         # Utility functions
-        style, strip_ansi
+        style, strip_ansi, supports_color
     )
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if supports_color():
+        # Erase the display and home the cursor, without spawning clear/cls
+        sys.stdout.write("\033[2J\033[H")
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+# Pre-colored "[LEVEL]" tags for the known log levels
+LEVEL_TAGS = {
+    'INFO': cyan('[INFO]'),
+    'WARNING': yellow('[WARNING]'),
+    'ERROR': red('[ERROR]'),
+    'SUCCESS': green('[SUCCESS]'),
+    'DEBUG': magenta('[DEBUG]'),
+}
 
-def log_message(level, message):
+# The lookups log_message makes on every line are bound as default arguments
+# so they resolve as locals
+def log_message(level, message, _tags=LEVEL_TAGS, _now=datetime.now,
+                _time_fmt='%Y-%m-%d %H:%M:%S', _bold=bold):
     """Print a formatted log message with appropriate coloring."""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    if level == 'INFO':
-        level_str = cyan(f'[{level}]')
-    elif level == 'WARNING':
-        level_str = yellow(f'[{level}]')
-    elif level == 'ERROR':
-        level_str = red(f'[{level}]')
-    elif level == 'SUCCESS':
-        level_str = green(f'[{level}]')
-    elif level == 'DEBUG':
-        level_str = magenta(f'[{level}]')
-    else:
-        level_str = f'[{level}]'
-    
-    print(f"{bold(timestamp)} {level_str} {message}")
+    timestamp = _now().strftime(_time_fmt)
+    level_str = _tags.get(level) or f'[{level}]'
+    print(f"{_bold(timestamp)} {level_str} {message}")
 
 def show_status_messages():
     """Demonstrate colored status messages."""
@@ -105,49 +109,67 @@ def show_status_messages():
     print(bg_yellow(black(' PENDING ')), "Waiting for external API response")
     print(bg_blue(white(' INFO ')), "Background task scheduled for midnight")
 
+# Spinner glyphs and colors, with every colored glyph rendered up front
+SPINNER_CHARS = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+SPINNER_COLORS = (red, yellow, green, cyan, blue, magenta)
+SPINNER_FRAMES = tuple(color(char) for color in SPINNER_COLORS for char in SPINNER_CHARS)
+
 def show_progress_indicators():
     """Demonstrate progress indicators with colors."""
     print(bold(underline("\nProgress Indicators:")))
     
-    # Simple progress bar
+    # Simple progress bar: every frame is rendered up front, the loop only writes
     total = 20
-    print("\nDownloading updates:")
+    bar_length = 30
+    frames = []
     for i in range(total + 1):
         progress = i / total
-        bar_length = 30
         filled_length = int(bar_length * progress)
         
         # Color the progress bar based on completion percentage
         if progress < 0.3:
-            bar = red('█' * filled_length) + '░' * (bar_length - filled_length)
+            bar_color = red
         elif progress < 0.6:
-            bar = yellow('█' * filled_length) + '░' * (bar_length - filled_length)
+            bar_color = yellow
         else:
-            bar = green('█' * filled_length) + '░' * (bar_length - filled_length)
-        
-        percent = bright_white(f"{int(100 * progress)}%")
+            bar_color = green
         
-        sys.stdout.write(f"\r[{bar}] {percent}")
+        frames.append(f"\r[{bar_color('█' * filled_length)}{'░' * (bar_length - filled_length)}] "
+                      f"{bright_white(f'{int(100 * progress)}%')}")
+    
+    print("\nDownloading updates:")
+    for frame in frames:
+        sys.stdout.write(frame)
         sys.stdout.flush()
         time.sleep(0.1)
     print("\n")
     
     # Spinner with changing colors
     print("Processing data:")
-    spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-    colors = [red, yellow, green, cyan, blue, magenta]
-    
     for i in range(30):
-        char_idx = i % len(spinner_chars)
-        color_idx = i % len(colors)
+        char_idx = i % len(SPINNER_CHARS)
+        color_idx = i % len(SPINNER_COLORS)
         
-        spinner = colors[color_idx](spinner_chars[char_idx])
+        spinner = SPINNER_FRAMES[color_idx * len(SPINNER_CHARS) + char_idx]
         sys.stdout.write(f"\r{spinner} Processing... ")
         sys.stdout.flush()
         time.sleep(0.1)
     
     print(green("Done!"))
 
+# Bar colors by value: below 80, below 100, and the rest
+BAR_THRESHOLDS = (80, 100)
+BAR_COLORS = (red, yellow, green)
+
+# Heat map cells by load: below 30, 60 and 80 percent, and the rest
+HEAT_THRESHOLDS = (30, 60, 80)
+HEAT_BLOCKS = (
+    bg_color256(22, '  '),   # Dark green
+    bg_color256(220, '  '),  # Yellow
+    bg_color256(208, '  '),  # Orange
+    bg_color256(196, '  '),  # Red
+)
+
 def show_data_visualization():
     """Demonstrate data visualization with colors."""
     print(bold(underline("\nData Visualization:")))
@@ -166,19 +188,16 @@ def show_data_visualization():
     max_value = max(item[1] for item in data)
     scale_factor = 40 / max_value
     
+    # Assemble the whole chart and write it at once
+    lines = []
     for month, value in data:
         bar_length = int(value * scale_factor)
         
         # Color based on value
-        if value < 80:
-            bar_color = red
-        elif value < 100:
-            bar_color = yellow
-        else:
-            bar_color = green
-        
+        bar_color = BAR_COLORS[bisect.bisect_right(BAR_THRESHOLDS, value)]
         bar = bar_color('█' * bar_length)
-        print(f"{cyan(month):4} │ {bar} {value}")
+        lines.append(f"{cyan(month):4} │ {bar} {value}\n")
+    sys.stdout.write(''.join(lines))
     
     # Heat map
     print("\nServer Load Heat Map (Last 24 Hours):")
@@ -187,14 +206,7 @@ def show_data_visualization():
     
     for i, (hour, load) in enumerate(zip(hours, loads)):
         # Color based on load
-        if load < 30:
-            block = bg_color256(22, '  ')  # Dark green
-        elif load < 60:
-            block = bg_color256(220, '  ')  # Yellow
-        elif load < 80:
-            block = bg_color256(208, '  ')  # Orange
-        else:
-            block = bg_color256(196, '  ')  # Red
+        block = HEAT_BLOCKS[bisect.bisect_right(HEAT_THRESHOLDS, load)]
         
         hour_str = f"{hour:02d}:00"
         load_str = f"{load:.1f}%"
@@ -233,19 +245,24 @@ def show_interactive_menu():
     selected = 4
     print(f"\n{yellow('Selected:')} {bright_green(menu_items[selected-1][0])}")
     
-    # Show a dialog box
-    print("\n" + "┌" + "─" * 50 + "┐")
-    print("│" + bold(bright_blue(" System Diagnostics ")).center(50) + "│")
-    print("│" + " " * 50 + "│")
-    print("│" + " Running diagnostics, please wait...".ljust(50) + "│")
-    print("│" + " " * 50 + "│")
-    print("│" + green(" ✓ CPU: Normal").ljust(50) + "│")
-    print("│" + green(" ✓ Memory: Normal").ljust(50) + "│")
-    print("│" + yellow(" ⚠ Disk Space: 85% used").ljust(50) + "│")
-    print("│" + green(" ✓ Network: Connected").ljust(50) + "│")
-    print("│" + " " * 50 + "│")
-    print("│" + bright_green(" Diagnostics completed successfully! ").center(50) + "│")
-    print("└" + "─" * 50 + "┘")
+    # Show a dialog box, assembled first and written in one go
+    hr = "─" * 50
+    blank = " " * 50
+    box = "\n".join([
+        f"\n┌{hr}┐",
+        f"│{bold(bright_blue(' System Diagnostics ')).center(50)}│",
+        f"│{blank}│",
+        f"│{' Running diagnostics, please wait...'.ljust(50)}│",
+        f"│{blank}│",
+        f"│{green(' ✓ CPU: Normal').ljust(50)}│",
+        f"│{green(' ✓ Memory: Normal').ljust(50)}│",
+        f"│{yellow(' ⚠ Disk Space: 85% used').ljust(50)}│",
+        f"│{green(' ✓ Network: Connected').ljust(50)}│",
+        f"│{blank}│",
+        f"│{bright_green(' Diagnostics completed successfully! ').center(50)}│",
+        f"└{hr}┘",
+    ])
+    sys.stdout.write(box + "\n")
 
 def main():
     """Main function to run the demo."""
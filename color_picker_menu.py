@@ -11,15 +11,16 @@ Usage:
 
 import os
 import sys
-import re
-import subprocess
+from functools import partial
 try:
     # Try relative import first (when used as part of a package)
     from .ansi_color_picker import (
-        enable_windows_ansi, colorize, ALL_COLORS, BASIC_COLORS, BRIGHT_COLORS,
-        RGB_CUBE_COLORS, GRAYSCALE_COLORS, print_basic_colors, print_extended_colors,
+        enable_windows_ansi, colorize, BASIC_COLORS, BRIGHT_COLORS,
+        GRAYSCALE_COLORS, print_basic_colors, print_extended_colors,
         print_truecolor_samples, print_color_details, print_code_examples,
-        preview_colors, print_header
+        preview_colors, print_header, synchronized_output, FG_SEQ, BG_SEQ,
+        DEFAULT_BG, RESET, use_block_buffering,
+        press_any_key, PrintBuffer, colorize_fast
     )
 except ImportError:
     # Fall back to direct import (when run as a script)
@@ -28,10 +29,12 @@ except ImportError:
     # Add the parent directory to sys.path
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from ANSI_colors.ansi_color_picker import (
-        enable_windows_ansi, colorize, ALL_COLORS, BASIC_COLORS, BRIGHT_COLORS,
-        RGB_CUBE_COLORS, GRAYSCALE_COLORS, print_basic_colors, print_extended_colors,
+        enable_windows_ansi, colorize, BASIC_COLORS, BRIGHT_COLORS,
+        GRAYSCALE_COLORS, print_basic_colors, print_extended_colors,
         print_truecolor_samples, print_color_details, print_code_examples,
-        preview_colors, print_header
+        preview_colors, print_header, synchronized_output, FG_SEQ, BG_SEQ,
+        DEFAULT_BG, RESET, use_block_buffering,
+        press_any_key, PrintBuffer, colorize_fast
     )
 
 # Enable ANSI colors
@@ -39,22 +42,33 @@ ANSI_ENABLED = enable_windows_ansi()
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if ANSI_ENABLED:
+        # Erase the display and home the cursor, without spawning clear/cls
+        sys.stdout.write("\033[2J\033[H")
+    else:
+        sys.stdout.flush()  # Pending output belongs before the clear
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+# The main menu options never change: render them once
+_MENU_TEXT = "\n".join([
+    "\nSelect an option:",
+    colorize("1. View Basic Colors (16 standard colors)", "36"),
+    colorize("2. View Extended Color Palette (256 colors)", "36"),
+    colorize("3. View True Color Samples (24-bit RGB)", "36"),
+    colorize("4. Color Details & Information", "36"),
+    colorize("5. Text Preview with Custom Colors", "36"),
+    colorize("6. Python Code Examples", "36"),
+    colorize("7. Color Combination Explorer", "36"),
+    colorize("8. Exit", "36"),
+    "",
+])
 
 def print_menu():
     """Print the main menu."""
     clear_screen()
     print_header("ANSI Color Picker - Interactive Menu")
     
-    print("\nSelect an option:")
-    print(colorize("1. View Basic Colors (16 standard colors)", "36"))
-    print(colorize("2. View Extended Color Palette (256 colors)", "36"))
-    print(colorize("3. View True Color Samples (24-bit RGB)", "36"))
-    print(colorize("4. Color Details & Information", "36"))
-    print(colorize("5. Text Preview with Custom Colors", "36"))
-    print(colorize("6. Python Code Examples", "36"))
-    print(colorize("7. Color Combination Explorer", "36"))
-    print(colorize("8. Exit", "36"))
+    sys.stdout.write(_MENU_TEXT)
     
     return input("\nEnter your choice (1-8): ")
 
@@ -74,32 +88,30 @@ def color_details_menu():
         
         choice = input("\nEnter your choice (1-6): ")
         
-        if choice == '1':
-            display_color_group(BASIC_COLORS, "Basic Colors", 0)
-        elif choice == '2':
-            display_color_group(BRIGHT_COLORS, "Bright Colors", 8)
-        elif choice == '3':
-            display_rgb_cube_colors()
-        elif choice == '4':
-            display_color_group(GRAYSCALE_COLORS, "Grayscale Colors", 232)
-        elif choice == '5':
-            try:
-                color_num = int(input("\nEnter color number (0-255): "))
-                if 0 <= color_num < 256:
-                    clear_screen()
-                    print_color_details(color_num)
-                    input("\nPress Enter to continue...")
-                else:
-                    print("\nInvalid color number. Must be between 0 and 255.")
-                    input("\nPress Enter to continue...")
-            except ValueError:
-                print("\nInvalid input. Please enter a number.")
-                input("\nPress Enter to continue...")
-        elif choice == '6':
+        action = _DETAILS_MENU.get(choice, _invalid_choice)
+        if action is None:  # Return to main menu
             return
+        action()
+
+def _invalid_choice():
+    """Report a menu choice that is not on the menu."""
+    print("\nInvalid choice. Please try again.")
+    press_any_key()
+
+def _enter_color_number():
+    """Ask for a palette number and show its details."""
+    try:
+        color_num = int(input("\nEnter color number (0-255): "))
+        if 0 <= color_num < 256:
+            clear_screen()
+            print_color_details(color_num)
+            press_any_key()
         else:
-            print("\nInvalid choice. Please try again.")
-            input("\nPress Enter to continue...")
+            print("\nInvalid color number. Must be between 0 and 255.")
+            press_any_key()
+    except ValueError:
+        print("\nInvalid input. Please enter a number.")
+        press_any_key()
 
 def display_color_group(colors, title, start_index):
     """Display a group of colors with their details."""
@@ -108,41 +120,54 @@ def display_color_group(colors, title, start_index):
     
     for i, color in enumerate(colors):
         color_num = start_index + i
-        fg_sample = colorize("Text", color.ansi_fg)
-        bg_sample = colorize("Text", None, color.ansi_bg)
+        fg_sample = colorize_fast("Text", color.fg_seq)
+        bg_sample = colorize_fast("Text", bg_seq=color.bg_seq)
         
         print(f"\nColor {color_num}: {color.name}")
         print(f"  ANSI Codes: \\033[{color.ansi_fg}m (FG), \\033[{color.ansi_bg}m (BG)")
         print(f"  RGB: {color.rgb}, Hex: {color.hex}")
         print(f"  Samples: {fg_sample} {bg_sample}")
     
-    input("\nPress Enter to continue...")
+    press_any_key()
+
+# First layer (red 0) of the RGB cube, one row per green level; rendered once
+# at import since the palette is fixed
+_CUBE_LAYER_SAMPLE = ''.join(
+    "\n" + ''.join(colorize_fast(f" {n:3d} ", bg_seq=BG_SEQ[n]) + " "
+                   for n in range(first, first + 6))
+    for first in range(16, 52, 6)
+)
 
 def display_rgb_cube_colors():
     """Display the RGB cube colors in a structured way."""
     clear_screen()
-    print_header("RGB Cube Colors (16-231)")
-    
-    print("\nThe RGB cube consists of 216 colors arranged in a 6×6×6 cube.")
-    print("Each color is a combination of Red, Green, and Blue values.")
-    
-    # Display a simplified representation of the cube
-    print("\nColor number format: 16 + (36 × r) + (6 × g) + b")
-    print("Where r, g, b are values from 0 to 5")
-    
-    # Show a sample of the cube
-    print("\nSample of the RGB cube (first 36 colors):")
-    for r in range(1):  # Just show the first layer
-        for g in range(6):
-            print()
-            for b in range(6):
-                color_num = 16 + (r * 36) + (g * 6) + b
-                color = RGB_CUBE_COLORS[color_num - 16]
-                bg_color = colorize(f" {color_num:3d} ", None, color.ansi_bg)
-                print(f"{bg_color}", end=" ")
+    with synchronized_output():
+        print_header("RGB Cube Colors (16-231)")
+        
+        print("\nThe RGB cube consists of 216 colors arranged in a 6×6×6 cube.")
+        print("Each color is a combination of Red, Green, and Blue values.")
+        
+        # Display a simplified representation of the cube
+        print("\nColor number format: 16 + (36 × r) + (6 × g) + b")
+        print("Where r, g, b are values from 0 to 5")
+        
+        # Show a sample of the cube
+        print("\nSample of the RGB cube (first 36 colors):")
+        sys.stdout.write(_CUBE_LAYER_SAMPLE)
+        
+        print("\n\nTo see details for a specific color, use option 5 in the previous menu.")
     
-    print("\n\nTo see details for a specific color, use option 5 in the previous menu.")
-    input("\nPress Enter to continue...")
+    press_any_key()
+
+# Color details menu: choice -> action (None returns to the main menu)
+_DETAILS_MENU = {
+    '1': partial(display_color_group, BASIC_COLORS, "Basic Colors", 0),
+    '2': partial(display_color_group, BRIGHT_COLORS, "Bright Colors", 8),
+    '3': display_rgb_cube_colors,
+    '4': partial(display_color_group, GRAYSCALE_COLORS, "Grayscale Colors", 232),
+    '5': _enter_color_number,
+    '6': None,
+}
 
 def text_preview_menu():
     """Menu for previewing text with custom colors."""
@@ -157,124 +182,137 @@ def text_preview_menu():
         
         choice = input("\nEnter your choice (1-3): ")
         
-        if choice == '1':
-            try:
-                fg = input("\nEnter foreground color number (0-255, or leave empty for default): ")
-                bg = input("Enter background color number (0-255, or leave empty for default): ")
-                text = input("Enter text to preview (or leave empty for default): ")
-                
-                fg = int(fg) if fg else None
-                bg = int(bg) if bg else None
-                text = text if text else "Hello, ANSI colors!"
-                
-                clear_screen()
-                preview_colors(fg, bg, text)
-                input("\nPress Enter to continue...")
-            except ValueError:
-                print("\nInvalid input. Please enter valid numbers.")
-                input("\nPress Enter to continue...")
-        elif choice == '2':
-            try:
-                fg_input = input("\nEnter foreground RGB values (r,g,b or leave empty for default): ")
-                bg_input = input("Enter background RGB values (r,g,b or leave empty for default): ")
-                text = input("Enter text to preview (or leave empty for default): ")
-                
-                fg = fg_input if fg_input else None
-                bg = bg_input if bg_input else None
-                text = text if text else "Hello, ANSI colors!"
-                
-                clear_screen()
-                preview_colors(fg, bg, text)
-                input("\nPress Enter to continue...")
-            except ValueError:
-                print("\nInvalid input. Please enter valid RGB values.")
-                input("\nPress Enter to continue...")
-        elif choice == '3':
+        action = _PREVIEW_MENU.get(choice, _invalid_choice)
+        if action is None:  # Return to main menu
             return
-        else:
-            print("\nInvalid choice. Please try again.")
-            input("\nPress Enter to continue...")
+        action()
 
-def color_combination_explorer():
-    """Interactive tool to explore foreground and background color combinations."""
-    clear_screen()
-    print_header("Color Combination Explorer")
-    
-    print("\nThis tool helps you explore different combinations of foreground and background colors.")
-    print("Use arrow keys to navigate, 'q' to quit.")
-    
-    # Create a grid of color combinations
+def _preview_color_numbers():
+    """Ask for palette numbers and text, and show the preview."""
+    try:
+        fg = input("\nEnter foreground color number (0-255, or leave empty for default): ")
+        bg = input("Enter background color number (0-255, or leave empty for default): ")
+        text = input("Enter text to preview (or leave empty for default): ")
+        
+        fg = int(fg) if fg else None
+        bg = int(bg) if bg else None
+        text = text if text else "Hello, ANSI colors!"
+        
+        clear_screen()
+        preview_colors(fg, bg, text)
+        press_any_key()
+    except ValueError:
+        print("\nInvalid input. Please enter valid numbers.")
+        press_any_key()
+
+def _preview_rgb_values():
+    """Ask for RGB values and text, and show the preview."""
+    try:
+        fg_input = input("\nEnter foreground RGB values (r,g,b or leave empty for default): ")
+        bg_input = input("Enter background RGB values (r,g,b or leave empty for default): ")
+        text = input("Enter text to preview (or leave empty for default): ")
+        
+        fg = fg_input if fg_input else None
+        bg = bg_input if bg_input else None
+        text = text if text else "Hello, ANSI colors!"
+        
+        clear_screen()
+        preview_colors(fg, bg, text)
+        press_any_key()
+    except ValueError:
+        print("\nInvalid input. Please enter valid RGB values.")
+        press_any_key()
+
+# Text preview menu: choice -> action (None returns to the main menu)
+_PREVIEW_MENU = {
+    '1': _preview_color_numbers,
+    '2': _preview_rgb_values,
+    '3': None,
+}
+
+def _build_combo_grid():
+    """Render the 16x16 grid of basic/bright foreground and background combinations."""
     fg_colors = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
     bg_colors = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
     
-    # Print the grid header
-    print("\n     ", end="")
-    for bg in bg_colors:
-        print(f"BG{bg:2d} ", end="")
-    print()
-    
-    # Print the grid
-    for fg in fg_colors:
-        print(f"FG{fg:2d} ", end="")
-        for bg in bg_colors:
-            fg_code = ALL_COLORS[fg].ansi_fg
-            bg_code = ALL_COLORS[bg].ansi_bg
-            print(colorize("Ab", fg_code, bg_code), end=" ")
-        print()
+    # Grid header
+    out = ["\n     "]
+    out.extend(f"BG{bg:2d} " for bg in bg_colors)
+    out.append("\n")
     
-    print("\nExtended combinations:")
-    print("Try combinations like FG=196 (bright red) with BG=46 (bright green):")
-    fg, bg = 196, 46
-    fg_code = ALL_COLORS[fg].ansi_fg
-    bg_code = ALL_COLORS[bg].ansi_bg
-    print(colorize("Sample Text", fg_code, bg_code))
+    if not ANSI_ENABLED:
+        out.extend(f"FG{fg:2d} " + "Ab " * len(bg_colors) + "\n" for fg in fg_colors)
+        return ''.join(out)
     
-    print("\nOr FG=51 (cyan) with BG=90 (dark gray):")
-    fg, bg = 51, 90
-    fg_code = ALL_COLORS[fg].ansi_fg
-    bg_code = ALL_COLORS[bg].ansi_bg
-    print(colorize("Sample Text", fg_code, bg_code))
+    # The foreground is set once per row and only the background changes from
+    # cell to cell
+    for fg in fg_colors:
+        cells = ''.join(f"{BG_SEQ[bg]}Ab{DEFAULT_BG} " for bg in bg_colors)
+        out.append(f"FG{fg:2d} {FG_SEQ[fg]}{cells}{RESET}\n")
+    return ''.join(out)
+
+# The grid only depends on the fixed palette, so it is rendered once
+_COMBO_GRID = _build_combo_grid()
+
+def color_combination_explorer():
+    """Interactive tool to explore foreground and background color combinations."""
+    clear_screen()
+    with synchronized_output():
+        print_header("Color Combination Explorer")
+        
+        print("\nThis tool helps you explore different combinations of foreground and background colors.")
+        print("Use arrow keys to navigate, 'q' to quit.")
+        
+        # Grid of all basic/bright foreground and background combinations
+        sys.stdout.write(_COMBO_GRID)
+        
+        print("\nExtended combinations:")
+        print("Try combinations like FG=196 (bright red) with BG=46 (bright green):")
+        fg, bg = 196, 46
+        print(colorize_fast("Sample Text", FG_SEQ[fg], BG_SEQ[bg]))
+        
+        print("\nOr FG=51 (cyan) with BG=90 (dark gray):")
+        fg, bg = 51, 90
+        print(colorize_fast("Sample Text", FG_SEQ[fg], BG_SEQ[bg]))
     
-    input("\nPress Enter to continue...")
+    press_any_key()
+
+def _show_screen(render):
+    """Show one full-screen view and wait for a key."""
+    clear_screen()
+    render()
+    press_any_key()
+
+def _exit_program():
+    """Say goodbye and exit."""
+    clear_screen()
+    print("Thank you for using the ANSI Color Picker!")
+    sys.exit(0)
+
+# Main menu: choice -> action
+_MAIN_MENU = {
+    '1': partial(_show_screen, print_basic_colors),
+    '2': partial(_show_screen, print_extended_colors),
+    '3': partial(_show_screen, print_truecolor_samples),
+    '4': color_details_menu,
+    '5': text_preview_menu,
+    '6': partial(_show_screen, print_code_examples),
+    '7': color_combination_explorer,
+    '8': _exit_program,
+}
 
 def main():
     """Main function."""
-    if not ANSI_ENABLED:
-        print("Warning: ANSI color codes may not be supported in this terminal.")
-        input("Press Enter to continue anyway...")
-    
-    while True:
-        choice = print_menu()
+    # One output buffer for the whole session: everything drawn between two
+    # prompts goes out in one write when input() or press_any_key() flushes it
+    with use_block_buffering(), PrintBuffer():
+        if not ANSI_ENABLED:
+            print("Warning: ANSI color codes may not be supported in this terminal.")
+            press_any_key("Press any key to continue anyway...")
         
-        if choice == '1':
-            clear_screen()
-            print_basic_colors()
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            clear_screen()
-            print_extended_colors()
-            input("\nPress Enter to continue...")
-        elif choice == '3':
-            clear_screen()
-            print_truecolor_samples()
-            input("\nPress Enter to continue...")
-        elif choice == '4':
-            color_details_menu()
-        elif choice == '5':
-            text_preview_menu()
-        elif choice == '6':
-            clear_screen()
-            print_code_examples()
-            input("\nPress Enter to continue...")
-        elif choice == '7':
-            color_combination_explorer()
-        elif choice == '8':
-            clear_screen()
-            print("Thank you for using the ANSI Color Picker!")
-            sys.exit(0)
-        else:
-            print("\nInvalid choice. Please try again.")
-            input("\nPress Enter to continue...")
+        while True:
+            choice = print_menu()
+            _MAIN_MENU.get(choice, _invalid_choice)()
 
 if __name__ == '__main__':
     try:
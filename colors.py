@@ -1,46 +1,73 @@
 #!/usr/bin/env python3
 import sys, os
+try:
+    # Try relative import first (when used as part of a package)
+    from .ansi_color_picker import SYNC_BEGIN, SYNC_END
+except ImportError:
+    # Fall back to the sibling module (when run as a script, its directory is
+    # already on sys.path)
+    from ansi_color_picker import SYNC_BEGIN, SYNC_END
 
 COLOR_SHADES = {
-    'gray': list(range(232, 256)),
-    'red': [52, 88, 124, 160, 196, 203, 210, 217, 224],
-    'green': [22, 28, 34, 40, 46, 82, 118, 154, 190],
-    'yellow': [100, 142, 184, 190, 226, 227, 229, 230, 231],
-    'blue': [17, 18, 19, 20, 21, 27, 33, 39, 45, 81],
-    'magenta': [53, 89, 125, 161, 201, 207, 213, 219, 225],
-    'cyan': [23, 30, 37, 44, 51, 87, 123, 159, 195],
-    'white': [255],
-    'black': [16],  # treated specially in logic
+    'gray': tuple(range(232, 256)),
+    'red': (52, 88, 124, 160, 196, 203, 210, 217, 224),
+    'green': (22, 28, 34, 40, 46, 82, 118, 154, 190),
+    'yellow': (100, 142, 184, 190, 226, 227, 229, 230, 231),
+    'blue': (17, 18, 19, 20, 21, 27, 33, 39, 45, 81),
+    'magenta': (53, 89, 125, 161, 201, 207, 213, 219, 225),
+    'cyan': (23, 30, 37, 44, 51, 87, 123, 159, 195),
+    'white': (255,),
+    'black': (16,),  # treated specially in logic
 }
 
-def print_usage():
-    print("──────────────────────────────────────────────────────")
-    print("Usage: colors.py BG_COLOR FG_COLOR")
+# Pre-encoded 256-color foreground/background sequences
+_FG_BYTES = tuple(b"\033[38;5;%dm" % n for n in range(256))
+_BG_BYTES = tuple(b"\033[48;5;%dm" % n for n in range(256))
+
+# Background shades are shown in steps of 2
+COLOR_SHADES_BG_STEP2 = {name: shades[::2] for name, shades in COLOR_SHADES.items()}
+
+def _build_usage():
+    lines = ["──────────────────────────────────────────────────────",
+             "Usage: colors.py BG_COLOR FG_COLOR"]
     
-    # Print each color name in its respective color
-    print("Colors: ", end="")
-    color_names = list(COLOR_SHADES.keys())
-    for i, color in enumerate(color_names):
+    # Each color name in its respective color
+    names = []
+    for color in COLOR_SHADES:
         if color == 'black':
             # Use white background for black text to make it visible
             shade = 255
-            print(f"\033[48;5;{shade}m\033[38;5;16m{color}\033[0m", end="")
+            names.append(f"\033[48;5;{shade}m\033[38;5;16m{color}\033[0m")
         elif color == 'white':
             # Use black background for white text
             shade = 16
-            print(f"\033[48;5;{shade}m\033[38;5;255m{color}\033[0m", end="")
+            names.append(f"\033[48;5;{shade}m\033[38;5;255m{color}\033[0m")
         else:
             # Use middle shade of each color
             shade = COLOR_SHADES[color][len(COLOR_SHADES[color])//2]
-            print(f"\033[38;5;{shade}m{color}\033[0m", end="")
-            
-        # Add comma separator except for the last item
-        if i < len(color_names) - 1:
-            print(", ", end="")
-    print()
+            names.append(f"\033[38;5;{shade}m{color}\033[0m")
+    lines.append("Colors: " + ", ".join(names))
     
-    print("Example: python colors.py red yellow")
-    print("──────────────────────────────────────────────────────\n")
+    lines.append("Example: python colors.py red yellow")
+    lines.append("──────────────────────────────────────────────────────\n\n")
+    return "\n".join(lines)
+
+# The usage banner is static: render it once, and encode it only when it is
+# written, for whatever stdout is current then
+_USAGE = _build_usage()
+
+def _write_bytes(data):
+    # Pre-encoded output goes to the binary buffer, after anything already
+    # printed; text-only streams (StringIO, IDE consoles) get it decoded
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(data.decode(sys.stdout.encoding or 'utf-8'))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+
+def print_usage():
+    _write_bytes(_USAGE.encode(sys.stdout.encoding or 'utf-8', 'replace'))
 
 def print_color_grid(bg_color, fg_color):
     if bg_color not in COLOR_SHADES or fg_color not in COLOR_SHADES:
@@ -50,43 +77,62 @@ def print_color_grid(bg_color, fg_color):
     bg_fixed = bg_color == 'black'
     fg_fixed = fg_color == 'black'
 
-    bg_shades = [16] if bg_fixed else COLOR_SHADES[bg_color][::2]  # backgrounds in steps of 2
-    fg_shades = [16] if fg_fixed else COLOR_SHADES[fg_color]
+    bg_shades = (16,) if bg_fixed else COLOR_SHADES_BG_STEP2[bg_color]
+    fg_shades = (16,) if fg_fixed else COLOR_SHADES[fg_color]
 
-    print(f"\n🔷 Background: {bg_color}    🔶 Foreground: {fg_color}\n")
-    for fg in fg_shades:
-        for bg in bg_shades:
-            bg_code = 16 if bg_fixed else bg
+    # Synchronized update (DEC mode 2026): the terminal paints the grid in one go
+    sys.stdout.write(SYNC_BEGIN)
+    try:
+        print(f"\n🔷 Background: {bg_color}    🔶 Foreground: {fg_color}\n")
+        grid = []
+        for fg in fg_shades:
             fg_code = 16 if fg_fixed else fg
-            print(f"\033[48;5;{bg_code}m\033[38;5;{fg_code}m B={bg_code:3} F={fg_code:3} \033[0m", end='  ')
-        print("\n")
+            # The foreground is the same along a row: set it once, then switch
+            # only the background per cell (back to the default background for
+            # the gap) and reset once at the end of the row
+            grid.append(_FG_BYTES[fg_code])
+            for bg in bg_shades:
+                bg_code = 16 if bg_fixed else bg
+                grid.append(_BG_BYTES[bg_code] + b" B=%3d F=%3d \033[49m  " % (bg_code, fg_code))
+            grid.append(b"\033[0m\n\n")
+        # The rows are pure ASCII: write them to the binary buffer in one go
+        _write_bytes(b"".join(grid))
 
-    # Example usage print
-    sample_bg = bg_shades[len(bg_shades)//2] if not bg_fixed else 16
-    sample_fg = fg_shades[len(fg_shades)//2] if not fg_fixed else 16
-    print("\nExample Python print with ANSI codes:\n")
-    print(f'    print("\\033[48;5;{sample_bg}m\\033[38;5;{sample_fg}m Hello ANSI World \\033[0m")')
-    print("Output:")
-    print(f"    \033[48;5;{sample_bg}m\033[38;5;{sample_fg}m Hello ANSI World \033[0m\n")
+        # Example usage print
+        sample_bg = bg_shades[len(bg_shades)//2] if not bg_fixed else 16
+        sample_fg = fg_shades[len(fg_shades)//2] if not fg_fixed else 16
+        print("\nExample Python print with ANSI codes:\n")
+        print(f'    print("\\033[48;5;{sample_bg}m\\033[38;5;{sample_fg}m Hello ANSI World \\033[0m")')
+        print("Output:")
+        print(f"    \033[48;5;{sample_bg}m\033[38;5;{sample_fg}m Hello ANSI World \033[0m\n")
+    finally:
+        sys.stdout.write(SYNC_END)
+        sys.stdout.flush()
 
 def _enable_windows_ansi():
-    if os.name == 'nt':
-        try:
-            import ctypes
-            k32 = ctypes.windll.kernel32
-            h = k32.GetStdHandle(-11)
-            mode = ctypes.c_ulong()
-            if k32.GetConsoleMode(h, ctypes.byref(mode)):
-                k32.SetConsoleMode(h, mode.value | 0x0004)
-        except Exception:
-            pass
-
-def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        k32 = ctypes.windll.kernel32
+        h = k32.GetStdHandle(-11)
+        mode = ctypes.c_ulong()
+        if k32.GetConsoleMode(h, ctypes.byref(mode)):
+            return bool(k32.SetConsoleMode(h, mode.value | 0x0004))
+    except Exception:
+        pass
+    return False
+
+def clear_screen(ansi=True):
+    if ansi:
+        # Erase the display and home the cursor, without spawning clear/cls
+        sys.stdout.write("\033[2J\033[H")
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 if __name__ == "__main__":
-    _enable_windows_ansi()
-    clear_screen()
+    ansi = _enable_windows_ansi()
+    clear_screen(ansi)
     print_usage()
 
     if len(sys.argv) != 3: